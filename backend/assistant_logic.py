@@ -9,7 +9,7 @@ Core business logic for:
   - Purchase history tracking
 
 Data Persistence: JSON files
-  - grocery_list.json: Current items in the grocery list
+  - grocery_list.jsonl: Append-only log of grocery list changes (one record per line)
   - purchase_history.json: Historical purchase data for suggestions
   - categories.json: Predefined categories with items for browsing
 
@@ -18,9 +18,97 @@ Class: GroceryAssistant
 """
 
 import datetime
-import json
-from typing import List, Dict
-from models import Product
+import functools
+import os
+import stat
+import tempfile
+import threading
+from typing import List, Dict, Optional
+
+import msgspec
+import orjson
+from models import Product, ProductRecord
+
+# Buffer size for data file I/O, so each load/save is a handful of syscalls
+IO_BUFFER_SIZE = 65536
+
+# Reusable decoder for grocery list log lines
+_RECORD_DECODER = msgspec.json.Decoder(ProductRecord)
+
+# Lowercase item name -> healthier alternative
+HEALTHIER_ALTERNATIVES: Dict[str, str] = {
+    "white bread": "brown bread",
+    "soda": "water",
+    "chips": "nuts",
+    "white rice": "brown rice",
+    "regular milk": "almond milk",
+    "butter": "olive oil",
+    "ice cream": "greek yogurt",
+    "cookies": "whole grain oats",
+    "candy": "fresh fruit"
+}
+
+
+def _read_json(path: str):
+    """Read and decode a JSON file through a 64KB buffered reader"""
+    with open(path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        return orjson.loads(f.read())
+
+
+def _atomic_write(path: str, payload: bytes):
+    """Replace a file's contents with payload via a temp file and os.replace"""
+    # A unique temp file per write, so concurrent writers can't clobber each other's
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                    prefix=os.path.basename(path) + '.', suffix='.tmp')
+    # mkstemp creates the file as 0600; keep the target's existing mode instead
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    try:
+        with os.fdopen(fd, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            os.chmod(tmp_path, mode)
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _write_json(path: str, data):
+    """Encode data in memory and write it to a JSON file atomically"""
+    # orjson serializes date fields natively as ISO-8601 strings
+    _atomic_write(path, orjson.dumps(data))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_categories_cached(path: str, mtime_ns: Optional[int]) -> Dict[str, List[str]]:
+    """Parse the categories file; cached until its path or mtime changes"""
+    if mtime_ns is None:
+        return {}
+    try:
+        return _read_json(path)
+    except FileNotFoundError:
+        return {}
+
+
+@functools.lru_cache(maxsize=1)
+def _categories_json_cached(path: str, mtime_ns: Optional[int]) -> bytes:
+    """Pre-serialize the whole categories dict to JSON bytes, keyed like the parse cache"""
+    return orjson.dumps(_load_categories_cached(path, mtime_ns))
+
+
+@functools.lru_cache(maxsize=1)
+def _category_json_cached(path: str, mtime_ns: Optional[int]) -> Dict[str, bytes]:
+    """Pre-serialize each category's item list to JSON bytes, keyed like the parse cache"""
+    categories = _load_categories_cached(path, mtime_ns)
+    return {category: orjson.dumps(items) for category, items in categories.items()}
+
 
 class GroceryAssistant:
     """Main class for managing grocery list and providing smart suggestions"""
@@ -28,77 +116,210 @@ class GroceryAssistant:
     def __init__(self, purchase_history_file: str, grocery_list_file: str, categories_file: str = "categories.json"):
         """Initialize the assistant with file paths for data persistence"""
         self.items: List[Product] = []
+        # Lowercase item name -> positions of matching items in self.items
+        self._name_index: Dict[str, List[int]] = {}
+        # Keeps items, the name index and log counts in lockstep across
+        # FastAPI's threadpool workers
+        self._lock = threading.Lock()
+        self._history_dates: Dict[str, datetime.date] = {}
+        self._file_mtimes: Dict[str, Optional[int]] = {}
+        # Number of lines in the grocery list log
+        self._log_records = 0
         self.purchase_history_file = purchase_history_file
         self.grocery_list_file = grocery_list_file
         self.categories_file = categories_file
         self.purchase_history = self.load_purchase_history()
-        self.categories = self.load_categories()
         self.load_grocery_list()
 
     def load_purchase_history(self) -> Dict:
         """Load purchase history from JSON file for generating suggestions"""
         try:
-            with open(self.purchase_history_file, 'r') as f:
-                history = json.load(f)
+            history = _read_json(self.purchase_history_file)
                 
             normalized_history = {}
+            history_dates = {}
+            # Only non-lowercase keys (including case-duplicates) need cleaning
+            dirty = False
             for key, value in history.items():
                 lower_key = key.lower()
+                if key != lower_key:
+                    dirty = True
+                try:
+                    new_date = datetime.date.fromisoformat(value['last_purchase_date'])
+                except (KeyError, TypeError, ValueError):
+                    # Keep entries with a missing or malformed date, but leave them
+                    # out of _history_dates so suggestions skip them
+                    new_date = None
                 if lower_key in normalized_history:
-                    existing_date = datetime.datetime.strptime(normalized_history[lower_key]['last_purchase_date'], '%Y-%m-%d').date()
-                    new_date = datetime.datetime.strptime(value['last_purchase_date'], '%Y-%m-%d').date()
-                    if new_date > existing_date:
-                        normalized_history[lower_key]['last_purchase_date'] = value['last_purchase_date']
+                    existing_date = history_dates.get(lower_key)
+                    if new_date is not None and (existing_date is None or new_date > existing_date):
+                        if isinstance(normalized_history[lower_key], dict):
+                            normalized_history[lower_key]['last_purchase_date'] = value['last_purchase_date']
+                        else:
+                            normalized_history[lower_key] = value
+                        history_dates[lower_key] = new_date
                 else:
                     normalized_history[lower_key] = value
+                    if new_date is not None:
+                        history_dates[lower_key] = new_date
             
-            # Overwrite the file with the cleaned history
-            with open(self.purchase_history_file, 'w') as f:
-                json.dump(normalized_history, f, indent=4)
+            # Overwrite the file with the cleaned history, if anything was cleaned
+            if dirty:
+                _write_json(self.purchase_history_file, normalized_history)
                 
+            self._remember_mtime(self.purchase_history_file)
+
+            # Keep parsed dates alongside the history so suggestions don't re-parse them
+            self._history_dates = history_dates
             return normalized_history
             
-        except (FileNotFoundError, json.JSONDecodeError):
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            self._remember_mtime(self.purchase_history_file)
+            self._history_dates = {}
             return {}
 
     def load_categories(self) -> Dict[str, List[str]]:
-        """Load predefined categories with items for the category browser"""
+        """Load predefined categories with items, re-parsing only when categories.json changes"""
+        return _load_categories_cached(self.categories_file, self._get_mtime(self.categories_file))
+
+    def load_grocery_list(self):
+        """
+        Load the current grocery list by replaying the JSONL log.
+        Each line is either a product or a {"_op": "del", "name": ...} tombstone.
+        """
+        self.items = []
+        self._log_records = 0
         try:
-            with open(self.categories_file, 'r') as f:
-                return json.load(f)
+            with open(self.grocery_list_file, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                data = f.read()
         except FileNotFoundError:
-            return {}
+            self._import_legacy_grocery_list()
+            return
 
-    def load_grocery_list(self):
-        """Load the current grocery list from JSON file"""
+        # A torn final line would otherwise have the next append glued onto it
+        needs_compaction = bool(data) and not data.endswith(b"\n")
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = _RECORD_DECODER.decode(line)
+            except msgspec.DecodeError:
+                # Skip a torn or corrupt line rather than losing the whole list
+                needs_compaction = True
+                continue
+            self._log_records += 1
+            if record.op == "del":
+                self.items = [item for item in self.items if item.name.lower() != record.name]
+            else:
+                self.items.append(record.to_product())
+        self._rebuild_name_index()
+        if needs_compaction:
+            self.save_grocery_list()
+        else:
+            self._remember_mtime(self.grocery_list_file)
+
+    def _import_legacy_grocery_list(self):
+        """
+        Import items from a pre-log grocery_list.json (a single JSON array) when
+        the .jsonl log does not exist yet, and write them out as a new log.
+        """
+        self.items = []
+        self._rebuild_name_index()
+        base, ext = os.path.splitext(self.grocery_list_file)
+        if ext != '.jsonl':
+            self._remember_mtime(self.grocery_list_file)
+            return
+
+        legacy_file = base + '.json'
         try:
-            with open(self.grocery_list_file, 'r') as f:
-                data = json.load(f)
-                self.items = [Product(**item_data) for item_data in data]
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.items = []
+            data = _read_json(legacy_file)
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            self._remember_mtime(self.grocery_list_file)
+            return
+
+        self.items = [Product(**item_data) for item_data in data]
+        self._rebuild_name_index()
+        self.save_grocery_list()
+        # Move the legacy file aside so deleting the log later doesn't bring its items back
+        os.replace(legacy_file, legacy_file + '.imported')
 
     def save_grocery_list(self):
-        """Save the current grocery list to JSON file"""
-        with open(self.grocery_list_file, 'w') as f:
-            json.dump([item.dict() for item in self.items], f, indent=4, default=str)
+        """Compact the grocery list log: rewrite it with one line per current item"""
+        payload = b"".join(orjson.dumps(item.model_dump(mode='json')) + b"\n" for item in self.items)
+        _atomic_write(self.grocery_list_file, payload)
+        self._log_records = len(self.items)
+        self._remember_mtime(self.grocery_list_file)
+
+    def _append_grocery_record(self, record: Dict):
+        """Append a single record to the grocery list log"""
+        # Open per append so a log replaced by rename is never written through a stale handle
+        with open(self.grocery_list_file, 'ab', buffering=IO_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(record) + b"\n")
+        self._log_records += 1
+        self._remember_mtime(self.grocery_list_file)
+
+    def _sync_grocery_list(self):
+        """Reload the grocery list first if its log changed on disk since we last touched it"""
+        if self._get_mtime(self.grocery_list_file) != self._file_mtimes.get(self.grocery_list_file):
+            self.load_grocery_list()
+
+    def _rebuild_name_index(self):
+        """Rebuild the lowercase name -> positions index from self.items"""
+        self._name_index = {}
+        for position, item in enumerate(self.items):
+            self._name_index.setdefault(item.name.lower(), []).append(position)
+
+    # ============ CHANGE DETECTION ============
+
+    def _get_mtime(self, path: str) -> Optional[int]:
+        """Return the file's modification time in nanoseconds, or None if missing"""
+        try:
+            return os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _remember_mtime(self, path: str):
+        """Record the file's current mtime as the version held in memory"""
+        self._file_mtimes[path] = self._get_mtime(path)
+
+    def reload_if_changed(self):
+        """
+        Reload purchase history and grocery list only if their files were
+        modified outside this instance since they were last loaded or saved.
+        """
+        with self._lock:
+            if self._get_mtime(self.purchase_history_file) != self._file_mtimes.get(self.purchase_history_file):
+                self.purchase_history = self.load_purchase_history()
+            self._sync_grocery_list()
 
     # ============ GROCERY LIST OPERATIONS ============
 
     def add_item_to_list(self, item: Product) -> Product:
         """Add a new item to the grocery list and save to file"""
-        self.items.append(item)
-        self.save_grocery_list()
-        return item
+        with self._lock:
+            self._sync_grocery_list()
+            self.items.append(item)
+            self._name_index.setdefault(item.name.lower(), []).append(len(self.items) - 1)
+            self._append_grocery_record(item.model_dump(mode='json'))
+            return item
 
     def remove_item_from_list(self, item_name: str) -> bool:
         """Remove item from grocery list by name (case-insensitive)"""
-        initial_count = len(self.items)
-        self.items = [item for item in self.items if item.name.lower() != item_name.lower()]
-        if len(self.items) < initial_count:
-            self.save_grocery_list()
+        with self._lock:
+            self._sync_grocery_list()
+            name_lower = item_name.lower()
+            positions = self._name_index.pop(name_lower, None)
+            if not positions:
+                return False
+            for position in reversed(positions):
+                del self.items[position]
+            self._rebuild_name_index()
+            self._append_grocery_record({"_op": "del", "name": name_lower})
+            # Compact once dead lines (tombstones and the adds they cancel)
+            # make up more than half of the log
+            if len(self.items) * 2 < self._log_records:
+                self.save_grocery_list()
             return True
-        return False
 
     def get_grocery_list(self) -> List[Product]:
         """Get all items in the current grocery list"""
@@ -108,11 +329,20 @@ class GroceryAssistant:
 
     def get_categories(self) -> Dict[str, List[str]]:
         """Get all categories with their items for the category browser"""
-        return self.categories
+        return self.load_categories()
 
     def get_category_items(self, category: str) -> List[str]:
         """Get items in a specific category"""
-        return self.categories.get(category, [])
+        return self.load_categories().get(category, [])
+
+    def get_categories_json(self) -> bytes:
+        """Get all categories as JSON bytes, ready to send in a response"""
+        return _categories_json_cached(self.categories_file, self._get_mtime(self.categories_file))
+
+    def get_category_items_json(self, category: str) -> bytes:
+        """Get a category's items as pre-serialized JSON bytes"""
+        cached = _category_json_cached(self.categories_file, self._get_mtime(self.categories_file))
+        return cached.get(category, b"[]")
 
     # ============ SMART SUGGESTIONS ============
 
@@ -121,21 +351,16 @@ class GroceryAssistant:
         Suggest items that were purchased before but not in current list.
         Items purchased more than 14 days ago are suggested.
         """
+        if not self.purchase_history:
+            return []
         suggestions = []
-        current_list_lower = {item.name.lower() for item in self.items}
-        
-        processed_items = set()
-
-        for item_name, data in self.purchase_history.items():
-            item_name_lower = item_name.lower()
-            if item_name_lower in processed_items:
-                continue
-            
-            processed_items.add(item_name_lower)
-
-            if item_name_lower not in current_list_lower:
-                last_purchase_date = datetime.datetime.strptime(data['last_purchase_date'], '%Y-%m-%d').date()
-                if (datetime.date.today() - last_purchase_date).days > 7:
+        cutoff = datetime.date.today() - datetime.timedelta(days=7)
+        # History keys are already lowercase and unique after load_purchase_history;
+        # entries without a valid date have no _history_dates entry and are skipped
+        for item_name in self.purchase_history:
+            if item_name not in self._name_index:
+                last_purchase_date = self._history_dates.get(item_name)
+                if last_purchase_date is not None and last_purchase_date < cutoff:
                     suggestions.append(f"You bought {item_name} a last week, consider adding it.")
         return suggestions
 
@@ -144,33 +369,27 @@ class GroceryAssistant:
         Suggest healthier alternatives for items in the current list.
         E.g., brown bread instead of white bread, water instead of soda.
         """
+        if not self.items:
+            return []
         suggestions = []
-        healthier_alternatives = {
-            "white bread": "brown bread",
-            "soda": "water",
-            "chips": "nuts",
-            "white rice": "brown rice",
-            "regular milk": "almond milk",
-            "butter": "olive oil",
-            "ice cream": "greek yogurt",
-            "cookies": "whole grain oats",
-            "candy": "fresh fruit"
-        }
         for item in self.items:
-            if item.name.lower() in healthier_alternatives:
-                suggestion = healthier_alternatives[item.name.lower()]
+            suggestion = HEALTHIER_ALTERNATIVES.get(item.name.lower())
+            if suggestion:
                 suggestions.append(f"Instead of {item.name}, consider {suggestion} as a healthier alternative.")
         return suggestions
 
     def get_expiry_reminders(self) -> List[str]:
         """Get reminders for items expiring within 5 days (1-5 day window)"""
+        if not self.items:
+            return []
         reminders = []
         today = datetime.date.today()
+        earliest = today + datetime.timedelta(days=1)
+        latest = today + datetime.timedelta(days=5)
         for item in self.items:
-            if item.expiry_date:
+            if item.expiry_date and earliest <= item.expiry_date <= latest:
                 time_to_expiry = (item.expiry_date - today).days
-                if 1 <= time_to_expiry <= 5:
-                    reminders.append(f"Reminder: {item.name} is expiring in {time_to_expiry} days.")
+                reminders.append(f"Reminder: {item.name} is expiring in {time_to_expiry} days.")
         return reminders
 
     # ============ PURCHASE MANAGEMENT ============
@@ -181,17 +400,22 @@ class GroceryAssistant:
         1. Update purchase history with today's date for each item
         2. Clear the grocery list
         """
-        today_str = datetime.date.today().isoformat()
-        for item in self.items:
-            self.purchase_history[item.name.lower()] = {"last_purchase_date": today_str}
+        with self._lock:
+            today = datetime.date.today()
+            today_str = today.isoformat()
+            for item in self.items:
+                self.purchase_history[item.name.lower()] = {"last_purchase_date": today_str}
+                self._history_dates[item.name.lower()] = today
 
-        with open(self.purchase_history_file, 'w') as f:
-            json.dump(self.purchase_history, f, indent=4)
-        
-        self.items = []
-        self.save_grocery_list()
-        return {"message": "Purchase history updated and grocery list cleared."}
+            # Both files are encoded in memory and swapped into place atomically
+            _write_json(self.purchase_history_file, self.purchase_history)
+            self._remember_mtime(self.purchase_history_file)
+
+            self.items = []
+            self._name_index = {}
+            self.save_grocery_list()
+            return {"message": "Purchase history updated and grocery list cleared."}
 
 
 # Initialize the global assistant instance
-assistant = GroceryAssistant(purchase_history_file="purchase_history.json", grocery_list_file="grocery_list.json")
+assistant = GroceryAssistant(purchase_history_file="purchase_history.json", grocery_list_file="grocery_list.jsonl")
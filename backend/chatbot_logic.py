@@ -9,12 +9,33 @@ actions for the GroceryAssistant.
 import re
 from assistant_logic import assistant, Product
 
+# Regex to capture "add [quantity] [unit] of [item name] to [category]"
+_ADD_RE = re.compile(r"add\s+((?P<quantity>\d+(\.\d+)?)\s+)?(?P<unit>\w+)?(\s+of)?\s+(?P<name>[\w\s]+?)(\s+to\s+(?P<category>\w+))?$")
+# Regex to capture "remove [item name]"
+_REMOVE_RE = re.compile(r"remove\s+(?P<name>[\w\s]+)")
+# Single-pass intent keyword scan, whole words only; when a message contains
+# several keywords, Chatbot picks one by the priority order of its handlers
+_INTENT_RE = re.compile(r"\b(add|remove|expiring|suggestions|clear list|show list|list|purchase|hello|hi)\b")
+
 class Chatbot:
     """A simple chatbot to interact with the Grocery Assistant."""
 
     def __init__(self, assistant):
         """Initialize the chatbot with a GroceryAssistant instance."""
         self.assistant = assistant
+        # Keyword -> handler, in priority order when a message has several keywords
+        self._handlers = {
+            "add": self._handle_add,
+            "remove": self._handle_remove,
+            "expiring": self._handle_expiring,
+            "suggestions": self._handle_suggestions,
+            "clear list": self._handle_clear,
+            "show list": self._handle_list,
+            "list": self._handle_list,
+            "purchase": self._handle_purchase,
+            "hello": self._handle_greeting,
+            "hi": self._handle_greeting,
+        }
 
     def get_reply(self, message: str) -> dict:
         """
@@ -25,29 +46,17 @@ class Chatbot:
         reply = "Sorry, I don't understand."
         refresh = False
 
-        if "add" in message:
-            reply, refresh = self._handle_add(message)
-        elif "remove" in message:
-            reply, refresh = self._handle_remove(message)
-        elif "expiring" in message:
-            reply, refresh = self._handle_expiring(message)
-        elif "suggestions" in message:
-            reply, refresh = self._handle_suggestions(message)
-        elif "list" in message or "show list" in message:
-            reply, refresh = self._handle_list(message)
-        elif "clear list" in message:
-            reply, refresh = self._handle_clear(message)
-        elif "purchase" in message:
-            reply, refresh = self._handle_purchase(message)
-        elif "hello" in message or "hi" in message:
-            reply = "Hello! How can I help you with your groceries today?"
+        found = {match.group(1) for match in _INTENT_RE.finditer(message)}
+        for keyword, handler in self._handlers.items():
+            if keyword in found:
+                reply, refresh = handler(message)
+                break
 
         return {"reply": reply, "refresh": refresh}
 
     def _handle_add(self, message: str) -> (str, bool):
         """Handle adding an item to the grocery list."""
-        # Regex to capture "add [quantity] [unit] of [item name] to [category]"
-        match = re.search(r"add\s+((?P<quantity>\d+(\.\d+)?)\s+)?(?P<unit>\w+)?(\s+of)?\s+(?P<name>[\w\s]+?)(\s+to\s+(?P<category>\w+))?$", message)
+        match = _ADD_RE.search(message)
 
         if not match:
             return "I'm sorry, I couldn't figure out what to add. Please use the format: 'add [quantity] [unit] of [item name] to [category]'", False
@@ -63,7 +72,7 @@ class Chatbot:
 
     def _handle_remove(self, message: str) -> (str, bool):
         """Handle removing an item from the grocery list."""
-        match = re.search(r"remove\s+(?P<name>[\w\s]+)", message)
+        match = _REMOVE_RE.search(message)
         if not match:
             return "I'm sorry, I couldn't figure out what to remove. Please use the format: 'remove [item name]'", False
 
@@ -111,18 +120,22 @@ class Chatbot:
         self.assistant.mark_items_as_purchased()
         return "I've marked all items as purchased and updated your purchase history.", True
 
+    def _handle_greeting(self, message: str) -> (str, bool):
+        """Handle a greeting."""
+        return "Hello! How can I help you with your groceries today?", False
+
     def _get_list(self) -> str:
         """Get the current grocery list as a formatted string."""
         if not self.assistant.items:
             return "Your grocery list is empty."
 
-        list_str = "Here's your grocery list:\n"
+        lines = ["Here's your grocery list:"]
         for item in self.assistant.items:
-            list_str += f"- {item.name} ({item.unit}"
             if item.category:
-                list_str += f", {item.category}"
-            list_str += ")\n"
-        return list_str
+                lines.append(f"- {item.name} ({item.unit}, {item.category})")
+            else:
+                lines.append(f"- {item.name} ({item.unit})")
+        return "\n".join(lines)
 
 # Initialize the global chatbot instance
 chatbot = Chatbot(assistant)
@@ -20,12 +20,12 @@ Runs on: http://127.0.0.1:8000
 CORS: Enabled for all origins (safe for local development)
 
 Data Storage: JSON files in the backend directory
-  - grocery_list.json           - Current grocery items
+  - grocery_list.jsonl          - Current grocery items (append-only log)
   - purchase_history.json       - Purchase history for suggestions
   - categories.json             - Predefined categories and items
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from models import Product
@@ -73,35 +73,35 @@ def remove_item_from_list(item_name: str):
 @app.get("/categories", response_model=Dict[str, List[str]])
 def get_categories():
     """Fetch all categories with their items for browsing"""
-    return assistant.get_categories()
+    # Serve pre-serialized JSON; skips response model validation and re-encoding
+    return Response(content=assistant.get_categories_json(), media_type="application/json")
 
 @app.get("/categories/{category}", response_model=List[str])
 def get_category_items(category: str):
     """Fetch items in a specific category"""
-    return assistant.get_category_items(category)
+    return Response(content=assistant.get_category_items_json(category), media_type="application/json")
 
 # ============ SMART SUGGESTIONS & REMINDERS ============
 
 @app.get("/suggestions/missing")
 def get_missing_item_suggestions():
     """Suggest items that were purchased before but are not in current list"""
-    # Reload purchase history and grocery list to ensure suggestions use latest data
-    assistant.purchase_history = assistant.load_purchase_history()
-    assistant.load_grocery_list()
+    # Pick up external edits to the data files; otherwise serve from memory
+    assistant.reload_if_changed()
     return {"suggestions": assistant.suggest_missing_items()}
 
 @app.get("/suggestions/healthier")
 def get_healthier_alternative_suggestions():
     """Suggest healthier alternatives for items in the current list"""
-    # Ensure grocery list is current before suggesting alternatives
-    assistant.load_grocery_list()
+    # Pick up external edits to the data files; otherwise serve from memory
+    assistant.reload_if_changed()
     return {"suggestions": assistant.suggest_healthier_alternatives()}
 
 @app.get("/reminders/expiry")
 def get_expiry_reminders():
     """Get reminders for items expiring soon (within 3 days)"""
-    # Ensure grocery list is current before computing expiry reminders
-    assistant.load_grocery_list()
+    # Pick up external edits to the data files; otherwise serve from memory
+    assistant.reload_if_changed()
     return {"reminders": assistant.get_expiry_reminders()}
 
 # ============ CHATBOT ENDPOINT ============
@@ -2,9 +2,13 @@
 Data Models for Grocery Assistant
 
 Defines the Product model used for API requests/responses and data validation.
-Built with Pydantic for automatic JSON serialization and type validation.
+Built with Pydantic v2 for automatic JSON serialization and type validation.
+
+Also defines ProductRecord, a msgspec Struct used to decode the grocery list
+log quickly without running Pydantic validation on data we wrote ourselves.
 """
 
+import msgspec
 from pydantic import BaseModel
 from datetime import date
 from typing import Optional
@@ -32,3 +36,33 @@ class Product(BaseModel):
     category: Optional[str] = None
     purchase_date: Optional[date] = None
     expiry_date: Optional[date] = None
+
+
+class ProductRecord(msgspec.Struct):
+    """
+    One line of the grocery list log (grocery_list.jsonl).
+
+    Holds the same fields as Product, plus:
+    - op (str, optional): "del" for a removal tombstone, stored as "_op"
+
+    Example usage:
+      msgspec.json.decode(line, type=ProductRecord).to_product()
+    """
+    name: str
+    quantity: Optional[str] = None
+    unit: Optional[str] = None
+    category: Optional[str] = None
+    purchase_date: Optional[date] = None
+    expiry_date: Optional[date] = None
+    op: Optional[str] = msgspec.field(default=None, name="_op")
+
+    def to_product(self) -> Product:
+        """Build a Product from this record without re-running Pydantic validation"""
+        return Product.model_construct(
+            name=self.name,
+            quantity=self.quantity,
+            unit=self.unit,
+            category=self.category,
+            purchase_date=self.purchase_date,
+            expiry_date=self.expiry_date,
+        )
@@ -0,0 +1,60 @@
+"""Tests for the grocery list log persistence in GroceryAssistant."""
+
+import orjson
+
+from assistant_logic import GroceryAssistant
+from models import Product
+
+
+def make_assistant(tmp_path, grocery_list_file="grocery_list.jsonl"):
+    return GroceryAssistant(
+        purchase_history_file=str(tmp_path / "purchase_history.json"),
+        grocery_list_file=str(tmp_path / grocery_list_file),
+        categories_file=str(tmp_path / "categories.json"),
+    )
+
+
+def names(assistant):
+    return [item.name for item in assistant.get_grocery_list()]
+
+
+def test_log_round_trip_with_tombstones_and_compaction(tmp_path):
+    assistant = make_assistant(tmp_path)
+    for name in ["Milk", "Bread", "Eggs", "Tea"]:
+        assistant.add_item_to_list(Product(name=name, unit="pcs"))
+    assert assistant.remove_item_from_list("MILK")
+    assert not assistant.remove_item_from_list("rice")
+
+    log_lines = (tmp_path / "grocery_list.jsonl").read_bytes().splitlines()
+    assert len(log_lines) == 5
+    assert orjson.loads(log_lines[-1]) == {"_op": "del", "name": "milk"}
+    assert names(make_assistant(tmp_path)) == ["Bread", "Eggs", "Tea"]
+
+    # 2 live items in a 6-line log: dead lines pass half, so the log is compacted
+    assistant.remove_item_from_list("bread")
+    log_lines = (tmp_path / "grocery_list.jsonl").read_bytes().splitlines()
+    assert [orjson.loads(line)["name"] for line in log_lines] == ["Eggs", "Tea"]
+    assert names(make_assistant(tmp_path)) == ["Eggs", "Tea"]
+
+
+def test_torn_last_line_is_compacted_before_next_append(tmp_path):
+    (tmp_path / "grocery_list.jsonl").write_bytes(b'{"name":"x"}\n{"name":"Ap')
+    assistant = make_assistant(tmp_path)
+    assistant.add_item_to_list(Product(name="Milk"))
+
+    assert names(assistant) == ["x", "Milk"]
+    assert names(make_assistant(tmp_path)) == ["x", "Milk"]
+
+
+def test_legacy_json_list_is_imported_once(tmp_path):
+    legacy = tmp_path / "grocery_list.json"
+    legacy.write_bytes(orjson.dumps([{"name": "Apple", "expiry_date": "2030-01-01"}]))
+
+    assistant = make_assistant(tmp_path)
+    assert names(assistant) == ["Apple"]
+    assert not legacy.exists()
+    assert names(make_assistant(tmp_path)) == ["Apple"]
+
+    # Resetting the list by deleting the log must not bring the legacy items back
+    (tmp_path / "grocery_list.jsonl").unlink()
+    assert names(make_assistant(tmp_path)) == []